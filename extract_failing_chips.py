@@ -9,11 +9,73 @@ When run with ``--compare fileA.csv fileB.csv`` the script writes two reports:
 """
 
 import argparse
+import concurrent.futures
+import functools
+import hashlib
+import multiprocessing
+import os
+import pickle
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Tuple
 
+import numpy as np
 import pandas as pd
 
+# Parsed wafers are cached under $XDG_CACHE_HOME/failing_chips (default
+# ~/.cache). Setting FAILING_CHIPS_NO_CACHE to a non-empty value disables it.
+NO_CACHE_ENV = "FAILING_CHIPS_NO_CACHE"
+# Bump whenever the parse semantics or the cached layouts change so entries
+# written by older versions are never served.
+_CACHE_VERSION = 3
+
+FAILURE_COLUMNS = [
+    "XAdr",
+    "YAdr",
+    "test_item",
+    "unit",
+    "value",
+    "limit_high",
+    "limit_low",
+]
+
+# Columns identifying one measurement of one die.
+JOIN_KEYS = ["XAdr", "YAdr", "test_item"]
+
+STATUS_CATEGORIES = ["both_fail", "fail_in_a_only", "fail_in_b_only"]
+
+# Maps the categories of ``pd.merge(..., indicator=True)`` to coverage status.
+_MERGE_STATUS = {
+    "both": "both_fail",
+    "left_only": "fail_in_a_only",
+    "right_only": "fail_in_b_only",
+}
+
+# Number of lines read after the metadata block when locating the header rows.
+_HEADER_PROBE_ROWS = 16
+
+# Rows compared per block by the threshold scan.
+_SCAN_BLOCK_ROWS = 4096
+
+# Files larger than this are read in chunks of _CHUNK_ROWS data rows.
+_CHUNKED_READ_BYTES = 256 * 1024 * 1024
+_CHUNK_ROWS = 200_000
+
+# Each spawned worker re-imports pandas and the optional accelerators, so
+# reports are only written in parallel once the inputs repay that start-up.
+_PARALLEL_MIN_BYTES = 64 * 1024 * 1024
+
+# (headers, test_items, units, upper, lower, usecols, data_start)
+_Header = Tuple[
+    Tuple[str, ...],
+    Tuple[str, ...],
+    Tuple[str, ...],
+    np.ndarray,
+    np.ndarray,
+    Tuple[int, ...],
+    int,
+]
+
+
 def _unique_test_names(groups: List[str], items: List[str]) -> List[str]:
     """Return unique column names for group/item pairs.
 
@@ -33,90 +95,399 @@ def _unique_test_names(groups: List[str], items: List[str]) -> List[str]:
     return names
 
 
-def get_test_items(file_path: str, metadata_rows: int = 29) -> List[str]:
-    """Return list of test item names with group prefix and unique suffix."""
-    df_hdr = pd.read_csv(file_path, header=None, skiprows=metadata_rows, nrows=2)
-    test_groups = df_hdr.iloc[0, 8:].astype(str).tolist()
-    test_items = df_hdr.iloc[1, 8:].astype(str).tolist()
-    return _unique_test_names(test_groups, test_items)
+def _read_csv(file_path: str, **kwargs) -> pd.DataFrame:
+    """Read ``file_path`` with the pyarrow CSV engine when it is available.
 
+    The pyarrow tokenizer is multithreaded and noticeably faster on large
+    wafer dumps. Older pandas releases, environments without pyarrow and
+    files pyarrow cannot tokenize fall back to the default C engine.
+    """
+    try:
+        return pd.read_csv(file_path, engine="pyarrow", **kwargs)
+    except ImportError:
+        pass
+    except pd.errors.ParserError:
+        # pyarrow rejects ragged rows (short padding lines, a truncated last
+        # line) that the C engine pads with NaN.
+        pass
+    except ValueError as err:
+        # Only retry when the engine itself is unsupported; a parse error like
+        # a bad numeric cell would just fail again on the C engine.
+        if "pyarrow" not in str(err):
+            raise
+    return pd.read_csv(file_path, **kwargs)
+
+
+def _coerce_numeric(frame: pd.DataFrame, dtypes: dict) -> pd.DataFrame:
+    """Return ``frame`` cast to ``dtypes`` with unparsable cells as NaN."""
+    text_cols = [
+        col for col in frame.columns if not pd.api.types.is_numeric_dtype(frame[col])
+    ]
+    if text_cols:
+        frame[text_cols] = frame[text_cols].apply(pd.to_numeric, errors="coerce")
+    return frame.astype(dtypes)
+
+
+def _read_data(
+    file_path: str, dtypes: dict, coerce: bool = False, **kwargs
+) -> Iterator[pd.DataFrame]:
+    """Yield the data block of a wafer CSV as numeric frames.
+
+    By default the reader parses straight into ``dtypes`` and raises
+    ``ValueError`` on any non-numeric cell. With ``coerce`` the columns are
+    inferred instead and those that did not parse as numbers are coerced, so
+    placeholders such as ``-`` or ``NA`` become NaN.
+    """
+    if not coerce:
+        kwargs["dtype"] = dtypes
+    if os.path.getsize(file_path) <= _CHUNKED_READ_BYTES:
+        frame = _read_csv(file_path, **kwargs)
+        yield _coerce_numeric(frame, dtypes) if coerce else frame
+        return
 
+    # Very large dumps are streamed so peak memory stays bounded by the chunk
+    # size; the pyarrow engine cannot stream, so use the C engine. The reader
+    # is closed even when a chunk fails to parse.
+    with pd.read_csv(file_path, chunksize=_CHUNK_ROWS, **kwargs) as reader:
+        for frame in reader:
+            yield _coerce_numeric(frame, dtypes) if coerce else frame
 
 
+def _write_csv(df: pd.DataFrame, path: str) -> None:
+    """Write ``df`` to ``path`` without the index.
 
-def parse_wafer_csv(file_path: str, metadata_rows: int = 29) -> pd.DataFrame:
-    """Return DataFrame of failing chip coordinates for a wafer CSV."""
-    df_all = pd.read_csv(file_path, header=None, skiprows=metadata_rows)
-    df_all = df_all.dropna(axis=1, how="all")
-    df_all = df_all.dropna(how="all").reset_index(drop=True)
-    if len(df_all) < 6:
-        raise ValueError("CSV format unexpected; not enough rows after metadata")
+    Uses pyarrow's threaded CSV writer when available and falls back to
+    ``DataFrame.to_csv`` otherwise.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        df.to_csv(path, index=False)
+        return
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+
+
+def _cache_dir() -> Path | None:
+    """Return the cache directory, or ``None`` when caching is disabled."""
+    if os.environ.get(NO_CACHE_ENV):
+        return None
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "failing_chips"
+
+
+def _file_stamp(file_path: str) -> Tuple[int, int]:
+    """Return ``(mtime_ns, size)`` identifying the current contents of a file.
+
+    The size catches rewrites that preserve the modification time, as done by
+    ``cp -p``, ``rsync -t`` or tar.
+    """
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _cache_path(
+    file_path: str, stamp: Tuple[int, int], metadata_rows: int, suffix: str
+) -> Path | None:
+    """Return the on-disk cache location for a parsed wafer CSV.
+
+    The name is ``<digest>-<mtime_ns>-<size><suffix>`` where the digest covers
+    the cache version, absolute path and ``metadata_rows``, so every version
+    of one file shares a prefix and older entries can be pruned on write.
+    """
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+    key = f"{_CACHE_VERSION}\0{os.path.abspath(file_path)}\0{metadata_rows}"
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    mtime_ns, size = stamp
+    return cache_dir / f"{digest}-{mtime_ns}-{size}{suffix}"
+
+
+def _store_cache(path: Path | None, write) -> None:
+    """Call ``write(tmp_path)``, move the result to ``path`` and prune.
+
+    Entries for earlier versions of the same file are removed so the cache
+    holds at most one entry per file and kind. Cache writes are best effort:
+    an unwritable cache directory, a missing optional dependency or a failed
+    serialization simply leaves the entry uncached.
+    """
+    if path is None:
+        return
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write(tmp_path)
+        os.replace(tmp_path, path)
+        prefix = path.name.split("-", 1)[0]
+        suffix = path.name[path.name.index(".") :]
+        for stale in path.parent.glob(f"{prefix}-*{suffix}"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _is_header(header: object) -> bool:
+    """Return whether ``header`` has the layout of :data:`_Header`."""
+    if not (isinstance(header, tuple) and len(header) == 7):
+        return False
+    headers, test_items, units, upper, lower, usecols, data_start = header
+    return (
+        all(isinstance(part, tuple) for part in (headers, test_items, units, usecols))
+        and all(
+            isinstance(limits, np.ndarray) and limits.shape == (len(test_items),)
+            for limits in (upper, lower)
+        )
+        and len(units) == len(test_items)
+        and len(usecols) == len(headers)
+        and isinstance(data_start, int)
+    )
 
-    test_groups = df_all.iloc[0, 8:].astype(str).tolist()
-    test_items_raw = df_all.iloc[1, 8:].astype(str).tolist()
-    upper_limits = pd.to_numeric(df_all.iloc[2, 8:], errors="coerce")
-    lower_limits = pd.to_numeric(df_all.iloc[3, 8:], errors="coerce")
 
+def _parse_header(file_path: str, metadata_rows: int) -> _Header:
+    # Keep empty lines so the row index matches line positions in the file;
+    # the data offset below is derived from it.
+    df_hdr = pd.read_csv(
+        file_path,
+        header=None,
+        skiprows=metadata_rows,
+        nrows=_HEADER_PROBE_ROWS,
+        skip_blank_lines=False,
+    )
+    df_hdr = df_hdr.dropna(axis=1, how="all")
+    df_hdr = df_hdr.dropna(how="all")
+    if len(df_hdr) < 5:
+        raise ValueError("CSV format unexpected; not enough rows after metadata")
+    df_hdr = df_hdr.iloc[:5]
+
+    # Materialize the test columns of all five header rows in one go, then
+    # split the block row by row.
+    block = df_hdr.iloc[:, 8:].to_numpy(dtype=object)
+    test_groups = block[0].astype(str).tolist()
+    test_items_raw = block[1].astype(str).tolist()
+    upper_limits = pd.to_numeric(block[2], errors="coerce").astype(np.float64)
+    lower_limits = pd.to_numeric(block[3], errors="coerce").astype(np.float64)
 
     # Build unique column names to avoid collision when test_items repeat under
     # different groups or appear multiple times.
     test_items = _unique_test_names(test_groups, test_items_raw)
 
-    headers = df_all.iloc[4, :8].tolist() + test_items
-    units = df_all.iloc[4, 8:].astype(str).tolist()
+    headers = df_hdr.iloc[4, :8].tolist() + test_items
+    units = block[4].astype(str).tolist()
+
+    # Data starts on the line after the column-name row; blank or empty lines
+    # inside the header block are accounted for by using that row's position.
+    data_start = metadata_rows + int(df_hdr.index[4]) + 1
+    return (
+        tuple(headers),
+        tuple(test_items),
+        tuple(units),
+        upper_limits,
+        lower_limits,
+        tuple(int(c) for c in df_hdr.columns),
+        data_start,
+    )
+
 
-    data_rows = df_all.iloc[5:].copy()
-    data_rows = data_rows.iloc[:, : len(headers)]
+def _read_header(file_path: str, metadata_rows: int = 29) -> _Header:
+    """Return the parsed header block of a wafer CSV.
 
-    data_rows.columns = headers
-    data_rows = data_rows.dropna(how="all")
+    The result is ``(headers, test_items, units, upper, lower, usecols,
+    data_start)`` and is cached per file modification time and size so
+    repeated calls for the same file only tokenize the header once.
+    """
+    return _read_header_cached(file_path, _file_stamp(file_path), metadata_rows)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_header_cached(
+    file_path: str, stamp: Tuple[int, int], metadata_rows: int
+) -> _Header:
+    cache_path = _cache_path(file_path, stamp, metadata_rows, ".header.pkl")
+    header = None
+    if cache_path is not None:
+        try:
+            with open(cache_path, "rb") as fh:
+                header = pickle.load(fh)
+        except Exception:  # A missing or unreadable entry is just a miss.
+            header = None
+    if not _is_header(header):
+        header = _parse_header(file_path, metadata_rows)
+
+        def write(tmp_path: Path) -> None:
+            with open(tmp_path, "wb") as fh:
+                pickle.dump(header, fh)
+
+        _store_cache(cache_path, write)
+
+    # The limit arrays are shared by every caller of the cached header.
+    header[3].setflags(write=False)
+    header[4].setflags(write=False)
+    return header
+
+
+def get_test_items(file_path: str, metadata_rows: int = 29) -> List[str]:
+    """Return list of test item names with group prefix and unique suffix."""
+    return list(_read_header(file_path, metadata_rows)[1])
 
-    for col in ["XAdr", "YAdr"] + test_items:
-        data_rows[col] = pd.to_numeric(data_rows[col], errors="coerce")
 
-    failures = []
-    for idx, item in enumerate(test_items):
-        upper = upper_limits.iat[idx]
-        lower = lower_limits.iat[idx]
-        mask = (data_rows[item] > upper) | (data_rows[item] < lower)
-        failing = data_rows.loc[mask, ["XAdr", "YAdr", item]]
-        if failing.empty:
+def _scan_failures(
+    measurements: np.ndarray, upper: np.ndarray, lower: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(rows, cols)`` of readings outside their limits.
+
+    The table is compared in blocks of :data:`_SCAN_BLOCK_ROWS` rows so the
+    boolean scratch buffer stays small regardless of file size. Failures are
+    sparse, so only rows with at least one failing reading are expanded into
+    indices. NaNs compare false on both sides and never count as failures.
+    The result is ordered by column and then row, grouping it by test item.
+    """
+    row_parts: List[np.ndarray] = []
+    col_parts: List[np.ndarray] = []
+    for start in range(0, len(measurements), _SCAN_BLOCK_ROWS):
+        block = measurements[start : start + _SCAN_BLOCK_ROWS]
+        mask = (block > upper) | (block < lower)
+        candidates = np.flatnonzero(mask.any(axis=1))
+        if not len(candidates):
             continue
-        failing = failing.assign(
-            test_item=item,
-            unit=units[idx],
-            value=failing[item],
-            limit_high=upper,
-            limit_low=lower,
-        )
-        failures.append(
-            failing[
-                [
-                    "XAdr",
-                    "YAdr",
-                    "test_item",
-                    "unit",
-                    "value",
-                    "limit_high",
-                    "limit_low",
-                ]
-            ]
-        )
+        sub_rows, sub_cols = np.nonzero(mask[candidates])
+        row_parts.append(candidates[sub_rows] + start)
+        col_parts.append(sub_cols)
 
-    if failures:
-        return pd.concat(failures, ignore_index=True)
-    return pd.DataFrame(
+    if not row_parts:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    rows = np.concatenate(row_parts)
+    cols = np.concatenate(col_parts)
+    order = np.argsort(cols, kind="stable")
+    return rows[order], cols[order]
+
+
+def parse_wafer_csv(file_path: str, metadata_rows: int = 29) -> pd.DataFrame:
+    """Return DataFrame of failing chip coordinates for a wafer CSV.
+
+    Results are cached as Parquet under ``$XDG_CACHE_HOME/failing_chips``,
+    keyed by the file path, modification time, size and ``metadata_rows``, so
+    re-running a report on an unchanged file skips CSV parsing entirely. Set
+    the :data:`NO_CACHE_ENV` environment variable to disable the cache.
+    """
+    cache_path = _cache_path(
+        file_path, _file_stamp(file_path), metadata_rows, ".parquet"
+    )
+    if cache_path is not None:
+        try:
+            df = pd.read_parquet(cache_path, engine="pyarrow")
+        except Exception:  # A missing or unreadable entry is just a miss.
+            df = None
+        if (
+            df is not None
+            and list(df.columns) == FAILURE_COLUMNS
+            and isinstance(df["test_item"].dtype, pd.CategoricalDtype)
+        ):
+            # Parquet drops the categories of an empty categorical column, so
+            # take them from the header; a mismatch otherwise is a stale entry.
+            test_items = get_test_items(file_path, metadata_rows)
+            if df.empty or list(df["test_item"].cat.categories) == test_items:
+                df["test_item"] = df["test_item"].cat.set_categories(test_items)
+                return df
+
+    df = _parse_wafer_csv(file_path, metadata_rows)
+    _store_cache(
+        cache_path,
+        lambda tmp_path: df.to_parquet(tmp_path, engine="pyarrow", index=False),
+    )
+    return df
+
+
+def _narrow_coordinates(values: np.ndarray) -> np.ndarray:
+    """Return whole-number coordinates as the smallest lossless integer type.
+
+    Die coordinates are normally small whole numbers and fit in int16; larger
+    ones fall back to int64. Missing or fractional values keep the parsed
+    float dtype so nothing is altered.
+    """
+    if not (values == np.trunc(values)).all():
+        return values
+    info = np.iinfo(np.int16)
+    if len(values) and (values.min() < info.min or values.max() > info.max):
+        return values.astype(np.int64)
+    return values.astype(np.int16)
 
-        columns=[
-            "XAdr",
-            "YAdr",
-            "test_item",
-            "unit",
-            "value",
-            "limit_high",
-            "limit_low",
-        ]
 
+def _parse_wafer_csv(file_path: str, metadata_rows: int) -> pd.DataFrame:
+    headers, test_items, units, upper, lower, usecols, data_start = _read_header(
+        file_path, metadata_rows
+    )
+    test_items = list(test_items)
+
+    # Only the coordinates and measurements are needed, so the remaining
+    # columns are never tokenized into values. usecols is applied in file
+    # order, so names are passed in that same order.
+    wanted = sorted(
+        (usecols[headers.index(name)], name) for name in ["XAdr", "YAdr"] + test_items
+    )
+    # Coercion happens in the reader. Readings and limits stay float64 so a
+    # reading just past its limit is never rounded onto it.
+    dtypes = {col: np.float64 for _, col in wanted}
+    read_kwargs = dict(
+        header=None,
+        skiprows=data_start,
+        usecols=[pos for pos, _ in wanted],
+        names=[name for _, name in wanted],
+    )
+
+    def scan(frames: Iterable[pd.DataFrame]) -> list:
+        # Padding rows at the end of an export hold only NaNs, so they never
+        # fail and need no separate cleanup pass.
+        parts = []
+        for data_rows in frames:
+            measurements = data_rows[test_items].to_numpy(
+                dtype=np.float64, copy=False
+            )
+            rows, cols = _scan_failures(measurements, upper, lower)
+            parts.append(
+                (
+                    data_rows["XAdr"].to_numpy()[rows],
+                    data_rows["YAdr"].to_numpy()[rows],
+                    cols,
+                    measurements[rows, cols],
+                )
+            )
+        return parts
+
+    try:
+        parts = scan(_read_data(file_path, dtypes, **read_kwargs))
+    except ValueError:
+        # Tester exports sometimes put placeholders such as "-" or "X" in
+        # numeric cells; pandas' default NA markers such as "NA" already read
+        # as NaN. Re-read without the typed fast path and coerce those cells
+        # to NaN instead of failing the whole run.
+        parts = scan(_read_data(file_path, dtypes, coerce=True, **read_kwargs))
+
+    x, y, cols, values = (np.concatenate(arrays) for arrays in zip(*parts))
+    if len(parts) > 1:
+        # Each chunk is grouped by test item; regroup across chunks while
+        # keeping file order within a test item.
+        order = np.argsort(cols, kind="stable")
+        x, y, cols, values = x[order], y[order], cols[order], values[order]
+
+    x = _narrow_coordinates(x)
+    y = _narrow_coordinates(y)
+
+    # Every column is a freshly gathered array, so the frame can adopt them
+    # without another copy.
+    return pd.DataFrame(
+        {
+            "XAdr": x,
+            "YAdr": y,
+            "test_item": pd.Categorical.from_codes(cols, categories=test_items),
+            "unit": np.asarray(units, dtype=object)[cols],
+            "value": values,
+            "limit_high": upper[cols],
+            "limit_low": lower[cols],
+        },
+        copy=False,
     )
 
 
@@ -132,22 +503,28 @@ def compare_coverage(file_a: str, file_b: str) -> None:
         print("Both files have no failures to compare")
         return
 
+    # Share one sorted category set so the merge and groupby hash integer
+    # codes instead of strings.
+    test_item_categories = sorted(
+        set(df_a["test_item"].cat.categories) | set(df_b["test_item"].cat.categories)
+    )
+    df_a["test_item"] = df_a["test_item"].cat.set_categories(test_item_categories)
+    df_b["test_item"] = df_b["test_item"].cat.set_categories(test_item_categories)
+
     merged = pd.merge(
         df_a,
         df_b,
-        on=["XAdr", "YAdr", "test_item"],
+        on=JOIN_KEYS,
         how="outer",
         suffixes=("_a", "_b"),
+        indicator="status",
+    )
+    # The merge indicator already records which side each row came from.
+    merged["status"] = (
+        merged["status"]
+        .cat.rename_categories(_MERGE_STATUS)
+        .cat.reorder_categories(STATUS_CATEGORIES)
     )
-
-    def status(row: pd.Series) -> str:
-        if not pd.isna(row.get("value_a")) and not pd.isna(row.get("value_b")):
-            return "both_fail"
-        if not pd.isna(row.get("value_a")):
-            return "fail_in_a_only"
-        return "fail_in_b_only"
-
-    merged["status"] = merged.apply(status, axis=1)
 
     coverage = (
         len(merged[merged["status"] == "both_fail"]) / len(df_a) * 100
@@ -155,12 +532,12 @@ def compare_coverage(file_a: str, file_b: str) -> None:
         else 0.0
     )
 
-    merged.to_csv("coverage.csv", index=False)
+    _write_csv(merged, "coverage.csv")
     print(f"Coverage of {file_a} on {file_b}: {coverage:.2f}%")
     print("Detailed coverage written to coverage.csv")
 
     summary = summarize_by_test_item(merged, tests_a, tests_b)
-    summary.to_csv("summary.csv", index=False)
+    _write_csv(summary, "summary.csv")
     print("Summary written to summary.csv")
 
 
@@ -168,12 +545,28 @@ def summarize_by_test_item(
     df: pd.DataFrame, tests_a: set[str], tests_b: set[str]
 ) -> pd.DataFrame:
     """Return summary statistics grouped by test_item."""
-    grouped = df.groupby("test_item")
-    summary = grouped.agg(
-        fails_a=("value_a", lambda s: s.notna().sum()),
-        fails_b=("value_b", lambda s: s.notna().sum()),
-        both_fail=("status", lambda s: (s == "both_fail").sum()),
-    ).reset_index()
+    # Aggregate by counting category codes directly; with only three sums
+    # over a handful of test items this is far cheaper than a GroupBy. The
+    # notna masks are computed once and shared by all three counts.
+    test_item = df["test_item"].astype("category")
+    codes = test_item.cat.codes.to_numpy()
+    n_items = len(test_item.cat.categories)
+    a_present = df["value_a"].notna().to_numpy()
+    b_present = df["value_b"].notna().to_numpy()
+    keyed = codes >= 0
+
+    def count(mask: np.ndarray) -> np.ndarray:
+        return np.bincount(codes[keyed & mask], minlength=n_items)
+
+    observed = np.flatnonzero(count(keyed))
+    summary = pd.DataFrame(
+        {
+            "test_item": pd.Categorical.from_codes(observed, dtype=test_item.dtype),
+            "fails_a": count(a_present)[observed],
+            "fails_b": count(b_present)[observed],
+            "both_fail": count(a_present & b_present)[observed],
+        }
+    )
 
     summary["coverage_a_in_b"] = (
 
@@ -195,8 +588,15 @@ def summarize_by_test_item(
 
     )
 
-    summary["present_in_a"] = summary["test_item"].isin(tests_a)
-    summary["present_in_b"] = summary["test_item"].isin(tests_b)
+    # Look presence up by category code instead of hashing every test name
+    # against each set. The trailing False entry is hit by code -1, i.e. a
+    # test item missing from both files.
+    all_tests = sorted(tests_a | tests_b)
+    codes = pd.Categorical(summary["test_item"], categories=all_tests).codes
+    in_a = np.array([t in tests_a for t in all_tests] + [False])
+    in_b = np.array([t in tests_b for t in all_tests] + [False])
+    summary["present_in_a"] = in_a[codes]
+    summary["present_in_b"] = in_b[codes]
 
     return summary
 
@@ -207,7 +607,7 @@ def save_failures(path: str) -> None:
         print(f"No failures found in {path}")
         return
     out_path = f"{Path(path).stem}_failures.csv"
-    df.to_csv(out_path, index=False)
+    _write_csv(df, out_path)
     print(f"Saved failures to {out_path}")
 
 
@@ -222,6 +622,11 @@ def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
         metavar=("FILE_A", "FILE_B"),
         help="Compare failing chips between two CSV files",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the parsed-wafer cache",
+    )
     parser.add_argument(
         "csv",
         nargs="*",
@@ -230,14 +635,41 @@ def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
-def main(argv: List[str] | None = None) -> None:
-    args = parse_args(argv)
-
+def _run(args: argparse.Namespace) -> None:
+    """Write the reports requested on the command line."""
     if args.compare:
         compare_coverage(*args.compare)
 
-    for path in args.csv:
-        save_failures(path)
+    total_bytes = sum(os.path.getsize(path) for path in args.csv)
+    if len(args.csv) > 1 and total_bytes >= _PARALLEL_MIN_BYTES:
+        # Each report is independent, so parse the files in separate processes.
+        # Spawn rather than fork: pyarrow may already have started worker
+        # threads, and forked children can hang on them at exit.
+        context = multiprocessing.get_context("spawn")
+        with concurrent.futures.ProcessPoolExecutor(mp_context=context) as executor:
+            list(executor.map(save_failures, args.csv))
+    else:
+        for path in args.csv:
+            save_failures(path)
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = parse_args(argv)
+    if not args.no_cache:
+        _run(args)
+        return
+
+    # Set through the environment so worker processes inherit it, and put
+    # the previous value back so callers of main() are not affected.
+    previous = os.environ.get(NO_CACHE_ENV)
+    os.environ[NO_CACHE_ENV] = "1"
+    try:
+        _run(args)
+    finally:
+        if previous is None:
+            del os.environ[NO_CACHE_ENV]
+        else:
+            os.environ[NO_CACHE_ENV] = previous
 
 
 if __name__ == "__main__":